@@ -8,119 +8,223 @@ possible out-of-scope or possible duplicate records into subfolders.
 """
 
 import argparse
+import errno
+import io
 import json
 import logging
+import os
+import re
 import shutil
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, fall back to the stdlib parser
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# With more reports than this, work is spread over several worker threads;
+# it is dominated by file reads, writes and renames, which release the GIL.
+PARALLEL_THRESHOLD = 4
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+REPORT_SUFFIX = "-report"
+DESCRIPTOR_SEP = re.compile(r"[;,]\s*")
+
+
+class Report(NamedTuple):
+    """The QA report fields used by this tool, with their defaults applied once."""
+
+    record_id: Optional[str]
+    corrections: Dict
+    title_corrected: bool
+    abstract_corrected: bool
+    date_corrected: bool
+    descriptor_corrected: bool
+    affiliation_correction_recommended: bool
+    affiliation_corrections: List[Dict]
+    organizational_author_corrections: List[Dict]
+    scope_ok: Optional[bool]
+    duplicate_by_title: bool
+    duplicate_by_doi: bool
+    recommendations: List
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Report":
+        return cls(
+            record_id=data.get("record_id"),
+            corrections=data.get("corrections") or {},
+            title_corrected=data.get("title_corrected", True),
+            abstract_corrected=data.get("abstract_corrected", True),
+            date_corrected=data.get("date_corrected", True),
+            descriptor_corrected=data.get("descriptor_corrected", True),
+            affiliation_correction_recommended=data.get("affiliation_correction_recommended", True),
+            affiliation_corrections=data.get("affiliation_corrections") or [],
+            organizational_author_corrections=data.get("organizational_author_corrections") or [],
+            scope_ok=data.get("scope_ok"),
+            duplicate_by_title=data.get("duplicate_by_title", False),
+            duplicate_by_doi=data.get("duplicate_by_doi", False),
+            recommendations=data.get("recommendations") or [],
+        )
+
+
+class Entry(NamedTuple):
+    """One record's row in the Markdown report."""
+
+    key: str
+    record_path: Optional[str]
+    report_path: str
+    actions: List[str]
+    recommendations: List
+    unapplied: List[str]
+
+
+def load_json(path: Path, fast: bool = False) -> Optional[Dict]:
+    return parse_json(path, path.read_bytes(), fast)
 
-def load_json(path: Path) -> Optional[Dict]:
+
+def parse_json(path: Path, raw: bytes, fast: bool = False) -> Optional[Dict]:
+    # Records are written back, so they always go through the stdlib parser:
+    # orjson reads integers beyond 64 bits as floats and rejects NaN/Infinity.
+    # Read-only QA reports may use orjson; anything it rejects, or a record_id it
+    # read as a float, is re-read with the stdlib parser.
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError as exc:
+        if fast and orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+            else:
+                if not (isinstance(data, dict) and isinstance(data.get("record_id"), float)):
+                    return data
+        return json.loads(raw)
+    except ValueError as exc:
         logger.error("Invalid JSON: %s (%s)", path, exc)
         return None
 
 
-def save_json(path: Path, data: Dict, dry_run: bool) -> None:
+def load_report(path: Path) -> Optional[Report]:
+    data = load_json(path, fast=True)
+    if not isinstance(data, dict):
+        if data is not None:
+            logger.error("Unexpected QA report format: %s", path)
+        return None
+    return Report.from_dict(data)
+
+
+def dump_json(data: Dict) -> bytes:
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def save_json(path: Path, data: Dict, original: bytes, dry_run: bool) -> None:
     if dry_run:
         logger.info("Dry-run: would write %s", path)
         return
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    payload = dump_json(data)
+    if payload == original:
+        logger.info("Unchanged on disk, not rewriting %s", path)
+        return
+    path.write_bytes(payload)
 
 
-def report_key(report_path: Path, report_data: Dict) -> Optional[str]:
-    record_id = report_data.get("record_id")
+def report_key(report_path: Path, report: Report) -> Optional[str]:
+    record_id = report.record_id
     if record_id:
         return str(record_id)
-    stem = report_path.stem
-    if stem.endswith("-report"):
-        return stem[:-7]
-    return stem
+    return report_path.stem.removesuffix(REPORT_SUFFIX)
 
 
-def apply_title(record: Dict, correction: str) -> bool:
+def apply_title(metadata: Dict, correction: str, key: str) -> bool:
     if not correction:
         return False
-    metadata = record.setdefault("metadata", {})
     old = metadata.get("title", "")
     if old == correction:
         return False
     metadata["title"] = correction
-    logger.info("Title corrected: '%s' -> '%s'", old, correction)
+    logger.info("%s: Title corrected: '%s' -> '%s'", key, old, correction)
     return True
 
 
-def apply_abstract(record: Dict, correction: str) -> bool:
+def apply_abstract(metadata: Dict, correction: str, key: str) -> bool:
     if not correction:
         return False
-    metadata = record.setdefault("metadata", {})
     old = metadata.get("description", "")
     if old == correction:
         return False
     metadata["description"] = correction
-    logger.info("Abstract corrected")
+    logger.info("%s: Abstract corrected", key)
     return True
 
 
-def apply_publication_date(record: Dict, correction: str) -> bool:
+def apply_publication_date(metadata: Dict, correction: str, key: str) -> bool:
     if not correction:
         return False
-    metadata = record.setdefault("metadata", {})
     old = metadata.get("publication_date", "")
     if old == correction:
         return False
     metadata["publication_date"] = correction
-    logger.info("Publication date corrected: '%s' -> '%s'", old, correction)
+    logger.info("%s: Publication date corrected: '%s' -> '%s'", key, old, correction)
     return True
 
 
-def apply_affiliations(record: Dict, corrections: List[Dict]) -> int:
+def apply_affiliations(record: Dict, corrections: List[Dict], key: str) -> int:
     if not corrections:
         return 0
     creators = record.get("metadata", {}).get("creators", [])
+    aff_index: Dict[str, List[Dict]] = defaultdict(list)
+    for creator in creators:
+        for affiliation in creator.get("affiliations", []):
+            aff_index[affiliation.get("name", "")].append(affiliation)
+    log_info = logger.isEnabledFor(logging.INFO)
     applied = 0
     for correction in corrections:
         old_aff = correction.get("old_affiliation", "")
         new_aff = correction.get("recommended_affiliation", "")
         if not old_aff or not new_aff:
             continue
-        for creator in creators:
-            affiliations = creator.get("affiliations", [])
-            for affiliation in affiliations:
-                if affiliation.get("name", "") == old_aff:
-                    affiliation["name"] = new_aff
-                    applied += 1
-                    logger.info("Affiliation corrected: '%s' -> '%s'", old_aff, new_aff)
+        matches = aff_index.pop(old_aff, [])
+        for affiliation in matches:
+            affiliation["name"] = new_aff
+            applied += 1
+            if log_info:
+                logger.info("%s: Affiliation corrected: '%s' -> '%s'", key, old_aff, new_aff)
+        # Re-key under the new name so a later correction can still match it.
+        aff_index[new_aff].extend(matches)
     return applied
 
 
-def apply_org_authors(record: Dict, corrections: List[Dict]) -> int:
+def apply_org_authors(record: Dict, corrections: List[Dict], key: str) -> int:
     if not corrections:
         return 0
     creators = record.get("metadata", {}).get("creators", [])
+    org_index: Dict[str, List[Dict]] = defaultdict(list)
+    for creator in creators:
+        person_org = creator.get("person_or_org", {})
+        if person_org.get("type") == "organizational":
+            org_index[person_org.get("name")].append(person_org)
+    log_info = logger.isEnabledFor(logging.INFO)
     applied = 0
     for correction in corrections:
         old_org = correction.get("old_organizational_author", "")
         new_org = correction.get("recommended_organizational_author", "")
         if not old_org or not new_org:
             continue
-        for creator in creators:
-            person_org = creator.get("person_or_org", {})
-            if person_org.get("type") == "organizational" and person_org.get("name") == old_org:
-                person_org["name"] = new_org
-                applied += 1
-                logger.info("Org author corrected: '%s' -> '%s'", old_org, new_org)
+        matches = org_index.pop(old_org, [])
+        for person_org in matches:
+            person_org["name"] = new_org
+            applied += 1
+            if log_info:
+                logger.info("%s: Org author corrected: '%s' -> '%s'", key, old_org, new_org)
+        org_index[new_org].extend(matches)
     return applied
 
 
-def apply_descriptor_deletions(record: Dict, deletions: List[str]) -> bool:
+def apply_descriptor_deletions(record: Dict, deletions: List[str], key: str) -> bool:
     if not deletions:
         return False
     custom_fields = record.get("custom_fields", {})
@@ -129,20 +233,20 @@ def apply_descriptor_deletions(record: Dict, deletions: List[str]) -> bool:
         return False
 
     if isinstance(descriptors, str):
-        descriptor_list = [d.strip() for d in descriptors.replace(";", ",").split(",") if d.strip()]
+        descriptor_list = [d for d in (part.strip() for part in DESCRIPTOR_SEP.split(descriptors)) if d]
         original_is_str = True
     elif isinstance(descriptors, list):
         descriptor_list = descriptors[:]
         original_is_str = False
     else:
-        logger.warning("Unexpected descriptor format: %s", type(descriptors))
+        logger.warning("%s: Unexpected descriptor format: %s", key, type(descriptors))
         return False
 
-    deletions_lower = {d.lower() for d in deletions if d}
-    filtered = [d for d in descriptor_list if d.lower() not in deletions_lower]
-
-    if len(filtered) == len(descriptor_list):
+    deletions_lower = frozenset(d.lower() for d in deletions if d)
+    lowered = [d.lower() for d in descriptor_list]
+    if deletions_lower.isdisjoint(lowered):
         return False
+    filtered = [d for d, dl in zip(descriptor_list, lowered) if dl not in deletions_lower]
 
     if original_is_str:
         custom_fields["iaea:descriptors_cai_text"] = "; ".join(filtered)
@@ -150,25 +254,32 @@ def apply_descriptor_deletions(record: Dict, deletions: List[str]) -> bool:
         custom_fields["iaea:descriptors_cai_text"] = filtered
 
     record["custom_fields"] = custom_fields
-    logger.info("Descriptors deleted: %s", ", ".join(deletions))
+    logger.info("%s: Descriptors deleted: %s", key, ", ".join(deletions))
     return True
 
 
-def add_related_identifiers(record: Dict, identifiers: List[Dict]) -> int:
+def add_related_identifiers(record: Dict, identifiers: List[Dict], key: str) -> int:
     if not identifiers:
         return 0
-    metadata = record.setdefault("metadata", {})
-    existing = metadata.setdefault("related_identifiers", [])
-    existing_ids = {ri.get("identifier", "") for ri in existing}
-    added = 0
+    existing = record.get("metadata", {}).get("related_identifiers", [])
+    # Seeded with the record's identifiers and extended as we go, so repeats
+    # within the incoming list are dropped as well.
+    seen = {ri.get("identifier", "") for ri in existing}
+    new_identifiers: List[Dict] = []
     for identifier in identifiers:
         ident = identifier.get("identifier", "")
-        if ident and ident not in existing_ids:
-            existing.append(identifier)
-            existing_ids.add(ident)
-            added += 1
-            logger.info("Related identifier added: %s", ident)
-    return added
+        if ident and ident not in seen:
+            seen.add(ident)
+            new_identifiers.append(identifier)
+    if not new_identifiers:
+        return 0
+
+    metadata = record.setdefault("metadata", {})
+    metadata.setdefault("related_identifiers", []).extend(new_identifiers)
+    if logger.isEnabledFor(logging.INFO):
+        for identifier in new_identifiers:
+            logger.info("%s: Related identifier added: %s", key, identifier["identifier"])
+    return len(new_identifiers)
 
 
 def apply_qa_checked(record: Dict) -> bool:
@@ -180,31 +291,36 @@ def apply_qa_checked(record: Dict) -> bool:
 
 
 def safe_move(src: Path, dest_dir: Path, dry_run: bool) -> None:
-    dest_dir.mkdir(parents=True, exist_ok=True)
     dest = dest_dir / src.name
     if dest.exists():
+        # One listing instead of a stat per candidate; normcase keeps Windows case-insensitive.
+        with os.scandir(dest_dir) as it:
+            taken = {os.path.normcase(entry.name) for entry in it}
         stem = src.stem
         suffix = src.suffix
         i = 1
-        while True:
-            candidate = dest_dir / f"{stem}_{i}{suffix}"
-            if not candidate.exists():
-                dest = candidate
-                break
+        while os.path.normcase(f"{stem}_{i}{suffix}") in taken:
             i += 1
+        dest = dest_dir / f"{stem}_{i}{suffix}"
     if dry_run:
         logger.info("Dry-run: would move %s -> %s", src, dest)
         return
-    shutil.move(str(src), str(dest))
+    try:
+        os.replace(src, dest)
+    except OSError as exc:
+        # --out-of-scope-dir/--duplicates-dir may point to another filesystem.
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dest))
 
 
-def should_move_out_of_scope(report: Dict) -> bool:
-    return report.get("scope_ok") is False
+def should_move_out_of_scope(report: Report) -> bool:
+    return report.scope_ok is False
 
 
-def duplicate_reason(report: Dict) -> Optional[str]:
-    by_title = report.get("duplicate_by_title")
-    by_doi = report.get("duplicate_by_doi")
+def duplicate_reason(report: Report) -> Optional[str]:
+    by_title = report.duplicate_by_title
+    by_doi = report.duplicate_by_doi
     if by_title and by_doi:
         return "title and doi"
     if by_title:
@@ -214,54 +330,66 @@ def duplicate_reason(report: Dict) -> Optional[str]:
     return None
 
 
-def should_move_duplicate(report: Dict) -> bool:
+def should_move_duplicate(report: Report) -> bool:
     return bool(duplicate_reason(report))
 
 
-def apply_corrections(record: Dict, report: Dict) -> Tuple[bool, List[str], List[str]]:
+def apply_corrections(record: Dict, report: Report, key: str) -> Tuple[bool, List[str], List[str]]:
+    corrections = report.corrections
+    aff_corrections = report.affiliation_corrections
+    org_corrections = report.organizational_author_corrections
+    if not (corrections or aff_corrections or org_corrections):
+        return False, [], []
+
+    # Create metadata only when a title, abstract or date correction will be written.
+    metadata = record.get("metadata")
+    if metadata is None and (
+        (report.title_corrected and corrections.get("title"))
+        or (report.abstract_corrected and corrections.get("abstract"))
+        or (report.date_corrected and corrections.get("publication_date"))
+    ):
+        metadata = record["metadata"] = {}
     changed = False
     actions: List[str] = []
     unapplied: List[str] = []
-    corrections = report.get("corrections", {}) or {}
 
     if "title" in corrections:
-        if report.get("title_corrected", True):
-            if apply_title(record, corrections.get("title")):
+        if report.title_corrected:
+            if apply_title(metadata, corrections.get("title"), key):
                 actions.append("Title corrected")
                 changed = True
         else:
             unapplied.append("Title correction present but title_corrected=false")
 
     if "abstract" in corrections:
-        if report.get("abstract_corrected", True):
-            if apply_abstract(record, corrections.get("abstract")):
+        if report.abstract_corrected:
+            if apply_abstract(metadata, corrections.get("abstract"), key):
                 actions.append("Abstract corrected")
                 changed = True
         else:
             unapplied.append("Abstract correction present but abstract_corrected=false")
 
     if "publication_date" in corrections:
-        if report.get("date_corrected", True):
-            if apply_publication_date(record, corrections.get("publication_date")):
+        if report.date_corrected:
+            if apply_publication_date(metadata, corrections.get("publication_date"), key):
                 actions.append("Publication date corrected")
                 changed = True
         else:
             unapplied.append("Publication date correction present but date_corrected=false")
 
     if "delete_descriptor" in corrections:
-        if report.get("descriptor_corrected", True):
+        if report.descriptor_corrected:
             deletions = corrections.get("delete_descriptor")
             if isinstance(deletions, str):
                 deletions = [deletions]
-            if apply_descriptor_deletions(record, deletions or []):
+            if apply_descriptor_deletions(record, deletions or [], key):
                 actions.append("Descriptors deleted")
                 changed = True
         else:
             unapplied.append("Descriptor deletions present but descriptor_corrected=false")
 
-    aff_corrections = report.get("affiliation_corrections", []) or []
-    if report.get("affiliation_correction_recommended", True):
-        applied = apply_affiliations(record, aff_corrections)
+    if report.affiliation_correction_recommended:
+        applied = apply_affiliations(record, aff_corrections, key)
         if applied > 0:
             actions.append(f"Affiliations corrected ({applied})")
             changed = True
@@ -270,9 +398,8 @@ def apply_corrections(record: Dict, report: Dict) -> Tuple[bool, List[str], List
     elif aff_corrections:
         unapplied.append("Affiliation corrections present but affiliation_correction_recommended=false")
 
-    org_corrections = report.get("organizational_author_corrections", []) or []
     if org_corrections:
-        applied = apply_org_authors(record, org_corrections)
+        applied = apply_org_authors(record, org_corrections, key)
         if applied > 0:
             actions.append(f"Organizational authors corrected ({applied})")
             changed = True
@@ -283,7 +410,7 @@ def apply_corrections(record: Dict, report: Dict) -> Tuple[bool, List[str], List
     if related:
         if not isinstance(related, list):
             related = [related]
-        added = add_related_identifiers(record, related)
+        added = add_related_identifiers(record, related, key)
         if added > 0:
             actions.append(f"Related identifiers added ({added})")
             changed = True
@@ -291,11 +418,36 @@ def apply_corrections(record: Dict, report: Dict) -> Tuple[bool, List[str], List
     return changed, actions, unapplied
 
 
-def find_record_file(records_dir: Path, key: str) -> Optional[Path]:
-    candidate = records_dir / f"{key}.json"
-    if candidate.exists():
-        return candidate
-    return None
+def index_records_dir(records_dir: Path) -> Tuple[Dict[str, Path], List[Path]]:
+    """Scan records_dir once; returns ({normcased key: key.json}, all non-directory entries)."""
+    json_by_key: Dict[str, Path] = {}
+    files: List[Path] = []
+    with os.scandir(records_dir) as it:
+        for entry in it:
+            # DirEntry caches the file type from the listing, so this costs no extra stat.
+            if entry.is_dir():
+                continue
+            path = Path(entry.path)
+            files.append(path)
+            # normcase keeps lookups case-insensitive on Windows, like exists()/glob() there.
+            name = os.path.normcase(entry.name)
+            if name.endswith(".json"):
+                json_by_key[name[: -len(".json")]] = path
+    return json_by_key, files
+
+
+def claim_record_files(files: List[Path], keys: Iterable[str]) -> Dict[str, List[Path]]:
+    """Give each file to the longest normcased key it matches as key.*, so no file has two owners."""
+    wanted = set(keys)
+    claimed: Dict[str, List[Path]] = defaultdict(list)
+    for path in files:
+        parts = os.path.normcase(path.name).split(".")
+        for i in range(len(parts) - 1, 0, -1):
+            prefix = ".".join(parts[:i])
+            if prefix in wanted:
+                claimed[prefix].append(path)
+                break
+    return claimed
 
 
 def render_markdown(
@@ -305,65 +457,125 @@ def render_markdown(
     out_of_scope_dir: Path,
     duplicates_dir: Path,
     dry_run: bool,
-    entries: List[Dict],
+    entries: List[Entry],
     stats: Dict[str, int],
 ) -> None:
-    lines: List[str] = []
-    lines.append("# Local Auto-Correction Report")
-    lines.append("")
-    lines.append(f"- Generated: {datetime.now().isoformat(timespec='seconds')}")
-    lines.append(f"- Dry run: {'yes' if dry_run else 'no'}")
-    lines.append(f"- Records dir: {records_dir}")
-    lines.append(f"- QA dir: {qa_dir}")
-    lines.append(f"- Out-of-scope dir: {out_of_scope_dir}")
-    lines.append(f"- Duplicates dir: {duplicates_dir}")
-    lines.append("")
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- Reports processed: {stats.get('processed', 0)}")
-    lines.append(f"- Records corrected: {stats.get('corrected', 0)}")
-    lines.append(f"- Records moved (out-of-scope): {stats.get('moved_out', 0)}")
-    lines.append(f"- Records moved (duplicates): {stats.get('moved_dup', 0)}")
-    lines.append(f"- Records missing: {stats.get('missing', 0)}")
-    lines.append("")
-    lines.append("## Details")
-    lines.append("")
+    if dry_run:
+        logger.info("Dry-run: would write report %s", report_path)
+        return
+
+    buf = io.StringIO()
+    write = buf.write
+    write("# Local Auto-Correction Report\n")
+    write("\n")
+    write(f"- Generated: {datetime.now().isoformat(timespec='seconds')}\n")
+    write(f"- Records dir: {records_dir}\n")
+    write(f"- QA dir: {qa_dir}\n")
+    write(f"- Out-of-scope dir: {out_of_scope_dir}\n")
+    write(f"- Duplicates dir: {duplicates_dir}\n")
+    write("\n")
+    write("## Summary\n")
+    write("\n")
+    write(f"- Reports processed: {stats.get('processed', 0)}\n")
+    write(f"- Records corrected: {stats.get('corrected', 0)}\n")
+    write(f"- Records moved (out-of-scope): {stats.get('moved_out', 0)}\n")
+    write(f"- Records moved (duplicates): {stats.get('moved_dup', 0)}\n")
+    write(f"- Records missing: {stats.get('missing', 0)}\n")
+    write("\n")
+    write("## Details\n")
+    write("\n")
 
     if not entries:
-        lines.append("_No records processed._")
+        write("_No records processed._\n")
     else:
         for entry in entries:
-            lines.append(f"### {entry['key']}")
-            lines.append("")
-            if entry.get("record_path"):
-                lines.append(f"- Record file: `{entry['record_path']}`")
-            if entry.get("report_path"):
-                lines.append(f"- QA report: `{entry['report_path']}`")
-            if entry.get("actions"):
-                lines.append("- Actions:")
-                for action in entry["actions"]:
-                    lines.append(f"  - {action}")
+            write(f"### {entry.key}\n")
+            write("\n")
+            if entry.record_path:
+                write(f"- Record file: `{entry.record_path}`\n")
+            if entry.report_path:
+                write(f"- QA report: `{entry.report_path}`\n")
+            if entry.actions:
+                write("- Actions:\n")
+                for action in entry.actions:
+                    write(f"  - {action}\n")
             else:
-                lines.append("- Actions: none")
+                write("- Actions: none\n")
 
-            recommendations = entry.get("recommendations", [])
-            unapplied = entry.get("unapplied", [])
+            recommendations = entry.recommendations
+            unapplied = entry.unapplied
             if recommendations or unapplied:
-                lines.append("- Recommendations not applied:")
+                write("- Recommendations not applied:\n")
                 for rec in recommendations:
-                    lines.append(f"  - {rec}")
+                    write(f"  - {rec}\n")
                 for note in unapplied:
-                    lines.append(f"  - {note}")
+                    write(f"  - {note}\n")
             else:
-                lines.append("- Recommendations not applied: none")
-            lines.append("")
+                write("- Recommendations not applied: none\n")
+            write("\n")
 
-    if not dry_run:
-        report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-        logger.info("Report written to %s", report_path)
-    else:
-        report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-        logger.info("Dry-run report written to %s", report_path)
+    report_path.write_bytes(buf.getvalue().encode("utf-8"))
+    logger.info("Report written to %s", report_path)
+
+
+def _process_one(
+    key: str,
+    report: Report,
+    report_file_path: Path,
+    record_path: Optional[Path],
+    out_of_scope_dir: Path,
+    duplicates_dir: Path,
+    dry_run: bool,
+) -> Optional[Tuple[Entry, bool, bool, bool, bool]]:
+    """Correct one record; returns (entry, corrected, moved_out, moved_dup, missing).
+
+    Moves are only decided here; process() performs them in the main thread.
+    """
+    if not record_path:
+        logger.warning("No local record JSON found for %s", key)
+        entry = Entry(
+            key=key,
+            record_path=None,
+            report_path=str(report_file_path),
+            actions=["Record JSON missing"],
+            recommendations=report.recommendations,
+            unapplied=[],
+        )
+        return entry, False, False, False, True
+
+    raw = record_path.read_bytes()
+    record = parse_json(record_path, raw)
+    if record is None:
+        return None
+
+    corrections_changed, actions, unapplied = apply_corrections(record, report, key)
+    qa_changed = apply_qa_checked(record)
+    if qa_changed:
+        actions.append("QA checked flag set")
+    if corrections_changed or qa_changed:
+        save_json(record_path, record, raw, dry_run)
+
+    move_out = should_move_out_of_scope(report)
+    move_dup = should_move_duplicate(report)
+
+    if move_out:
+        actions.append(f"Moved to {out_of_scope_dir.name}")
+    elif move_dup:
+        reason = duplicate_reason(report) or "unknown"
+        actions.append(f"Moved to {duplicates_dir.name} (duplicate by {reason})")
+
+    if not actions:
+        actions.append("No changes applied")
+
+    entry = Entry(
+        key=key,
+        record_path=str(record_path),
+        report_path=str(report_file_path),
+        actions=actions,
+        recommendations=report.recommendations,
+        unapplied=unapplied,
+    )
+    return entry, corrections_changed, move_out, move_dup and not move_out, False
 
 
 def process(
@@ -374,90 +586,84 @@ def process(
     dry_run: bool,
     report_path: Path,
 ) -> None:
-    report_files = list(qa_dir.glob("*.json"))
+    # Resolve once so every report and record path below is already absolute.
+    records_root = records_dir.resolve()
+    report_files = list(qa_dir.resolve().glob("*.json"))
     if not report_files:
         logger.warning("No QA report files found in %s", qa_dir)
         return
 
-    report_map: Dict[str, Tuple[Dict, Path]] = {}
-    for report_file_path in report_files:
-        data = load_json(report_file_path)
-        if data is None:
-            continue
-        key = report_key(report_file_path, data)
-        if not key:
-            logger.warning("Skipping report with no key: %s", report_file_path)
-            continue
-        report_map[key] = (data, report_file_path)
+    json_by_key, record_files = index_records_dir(records_root)
+    workers = min(MAX_WORKERS, len(report_files)) if len(report_files) > PARALLEL_THRESHOLD else 1
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Queue each record as soon as its report is parsed, so record work overlaps
+        # the remaining report reads. The task loads the record itself, so it is
+        # released as soon as that task finishes.
+        keys = set()
+        futures: List["Future[Optional[Tuple[Entry, bool, bool, bool, bool]]]"] = []
+        for report_file_path, report in zip(report_files, executor.map(load_report, report_files)):
+            if report is None:
+                continue
+            key = report_key(report_file_path, report)
+            if not key:
+                logger.warning("Skipping report with no key: %s", report_file_path)
+                continue
+            if key in keys:
+                # The first report's task is already running on this record.
+                logger.warning("Skipping duplicate report for %s: %s", key, report_file_path)
+                continue
+            keys.add(key)
+            futures.append(
+                executor.submit(
+                    _process_one,
+                    key,
+                    report,
+                    report_file_path,
+                    json_by_key.get(os.path.normcase(key)),
+                    out_of_scope_dir,
+                    duplicates_dir,
+                    dry_run,
+                )
+            )
+
+        results = [future.result() for future in futures]
+
+    files_by_key = claim_record_files(record_files, (os.path.normcase(key) for key in keys))
 
     processed = 0
     corrected = 0
     moved_out = 0
     moved_dup = 0
     missing = 0
-    entries: List[Dict] = []
+    entries: List[Entry] = []
+    created_dirs = set()
 
-    for key, (report, report_file_path) in report_map.items():
-        record_path = find_record_file(records_dir, key)
-        if not record_path:
-            logger.warning("No local record JSON found for %s", key)
-            missing += 1
-            entries.append(
-                {
-                    "key": key,
-                    "record_path": None,
-                    "report_path": str(report_file_path.resolve()),
-                    "actions": ["Record JSON missing"],
-                    "recommendations": report.get("recommendations", []) or [],
-                    "unapplied": [],
-                }
-            )
+    for result in results:
+        if result is None:
             continue
-
-        record = load_json(record_path)
-        if record is None:
+        entry, was_corrected, was_moved_out, was_moved_dup, was_missing = result
+        entries.append(entry)
+        if was_missing:
+            missing += 1
             continue
-
         processed += 1
-        corrections_changed, actions, unapplied = apply_corrections(record, report)
-        qa_changed = apply_qa_checked(record)
-        if qa_changed:
-            actions.append("QA checked flag set")
-        if corrections_changed:
+        if was_corrected:
             corrected += 1
-        if corrections_changed or qa_changed:
-            save_json(record_path, record, dry_run)
-
-        move_out = should_move_out_of_scope(report)
-        move_dup = should_move_duplicate(report)
-
-        if move_out or move_dup:
-            dest_dir = out_of_scope_dir if move_out else duplicates_dir
-            for src in records_dir.glob(f"{key}.*"):
-                if src.is_dir():
-                    continue
+        if was_moved_out or was_moved_dup:
+            # Moves run here one at a time, so two workers can never pick the same free
+            # name in the destination and have the second move overwrite the first.
+            dest_dir = out_of_scope_dir if was_moved_out else duplicates_dir
+            # Create each move target once, right before the first file goes into it.
+            if not dry_run and dest_dir not in created_dirs:
+                dest_dir.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(dest_dir)
+            for src in files_by_key.get(os.path.normcase(entry.key), []):
                 safe_move(src, dest_dir, dry_run)
-            if move_out:
-                moved_out += 1
-                actions.append(f"Moved to {out_of_scope_dir.name}")
-            else:
-                moved_dup += 1
-                reason = duplicate_reason(report) or "unknown"
-                actions.append(f"Moved to {duplicates_dir.name} (duplicate by {reason})")
-
-        if not actions:
-            actions.append("No changes applied")
-
-        entries.append(
-            {
-                "key": key,
-                "record_path": str(record_path.resolve()),
-                "report_path": str(report_file_path.resolve()),
-                "actions": actions,
-                "recommendations": report.get("recommendations", []) or [],
-                "unapplied": unapplied,
-            }
-        )
+        if was_moved_out:
+            moved_out += 1
+        if was_moved_dup:
+            moved_dup += 1
 
     logger.info("Processed: %d", processed)
     logger.info("Corrected: %d", corrected)
@@ -491,13 +697,14 @@ def main() -> int:
     parser.add_argument("--out-of-scope-dir", default="Possible_Out_Of_Scope", help="Subfolder for out-of-scope records")
     parser.add_argument("--duplicates-dir", default="Possible_Duplicates", help="Subfolder for duplicate records")
     parser.add_argument("--dry-run", action="store_true", help="Show actions without writing or moving files")
+    parser.add_argument("--quiet", action="store_true", help="Only log warnings and errors")
     parser.add_argument(
         "--report",
         help="Path to Markdown report file (default: QA dir)",
     )
     args = parser.parse_args()
 
-    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, format="%(levelname)s: %(message)s")
 
     records_dir = Path(args.records_dir)
     qa_dir = Path(args.qa_dir)